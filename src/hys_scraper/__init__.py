@@ -1,3 +1,11 @@
-from hys_scraper.hys_scraper import HYS_Scraper
-
 __version__ = "0.1.0"
+
+
+def __getattr__(name):
+    # Import lazily (PEP 562) so that merely importing the package - e.g. for
+    # `python3 -m hys_scraper --help` - does not pay the pandas import cost
+    if name == "HYS_Scraper":
+        from hys_scraper.hys_scraper import HYS_Scraper
+
+        return HYS_Scraper
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,5 @@
 import argparse
 
-from hys_scraper import HYS_Scraper
-
 
 def main():
     """Runs the 'Have your Say' parser with command line arguments."""
@@ -37,6 +35,15 @@ def main():
         default=None,
         help="Minimum time between consecutive HTTP requests (in seconds).",
     )
+    parser.add_argument(
+        "--fmt",
+        metavar="fmt",
+        type=str,
+        default=None,
+        choices=["parquet", "feather", "csv"],
+        help="File format to save the dataframes in: 'parquet' (default), "
+        + "'feather', or 'csv'.",
+    )
 
     # Deviate from scraper's default values only if user specified something
     args = parser.parse_args()
@@ -47,9 +54,16 @@ def main():
         kwargs["download_attachments"] = False
     if args.sleep_time is not None:
         kwargs["sleep_time"] = args.sleep_time
+    scrape_kwargs = {}
+    if args.fmt is not None:
+        scrape_kwargs["fmt"] = args.fmt
+
+    # Only import the scraper (and with it pandas) once the arguments have parsed
+    # successfully - keeps e.g. `--help` fast
+    from hys_scraper import HYS_Scraper
 
     # Scrape using the user-set parameters
-    HYS_Scraper(args.publication_id, **kwargs).scrape()
+    HYS_Scraper(args.publication_id, **kwargs).scrape(**scrape_kwargs)
 
 
 if __name__ == "__main__":
@@ -3,9 +3,35 @@ import re
 import sys
 import json
 import time
+import shutil
 import requests
+import threading
+import requests_cache
+import numpy as np
 import pandas as pd
 from typing import List, Tuple
+from datetime import timedelta
+from urllib3.util.retry import Retry
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    # Parses the large allFeedback responses several times faster than stdlib json
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # Allows downloading PDFs over a single multiplexed HTTP/2 connection
+    import httpx
+except ImportError:
+    httpx = None
+
+
+# Matches lower-/upper-case boundaries, i.e. where camelCase words "change over"
+_SNAKE_CASE_RE = re.compile(r"([a-z0-9])([A-Z])")
 
 
 class HYS_Scraper:
@@ -43,9 +69,34 @@ class HYS_Scraper:
         """
         # Set up class attributes
         self.base_url = "https://ec.europa.eu/info/law/better-regulation/"
-        # Time of last request to a ec.europa.eu, as seconds since 1970-01-01
-        self.last_request = 0
+        # Earliest time (as time.monotonic timestamp) the next request to
+        # ec.europa.eu may be issued at - guarded by a lock as requests may come
+        # from multiple threads
+        self._next_allowed = 0.0
+        self._rate_lock = threading.Lock()
+        self.n_workers = 8  # Number of threads used to scrape pages in parallel
         self.max_print = 0  # Required for deleting (and rewriting) line
+        self._n_updates = 0  # Number of progress updates, used to batch flushes
+
+        # Use a single session so that keep-alive connections are reused across
+        # requests and failed requests are retried with exponential backoff
+        self.session = self._create_session()
+
+        # If httpx (with its http2 extra) is available, PDFs are downloaded over a
+        # single HTTP/2 connection that multiplexes the concurrent streams, instead
+        # of one TCP+TLS connection per worker thread
+        self._pdf_client = None
+        if httpx is not None:
+            try:
+                self._pdf_client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=16, max_connections=32
+                    ),
+                    timeout=30,
+                )
+            except ImportError:
+                pass  # The 'h2' package of the http2 extra is not installed
 
         # Copy arguments into class attributes
         self.publication_id = publication_id
@@ -66,8 +117,18 @@ class HYS_Scraper:
         # Try to create target directory, if it doesn't exist
         self._create_output_folder()
 
+        # Now that the target directory exists, swap in a session that caches the
+        # JSON responses on disk - re-runs are answered locally instead of re-hitting
+        # the 'Have your Say' plattform
+        self.session = self._create_session(
+            cache_name=f"{self.target_dir}/.http_cache"
+        )
+
     def scrape(
-        self, download_attachments: bool = None, save_dataframes: bool = True
+        self,
+        download_attachments: bool = None,
+        save_dataframes: bool = True,
+        fmt: str = "parquet",
     ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         """Scrape the initiative's feedback submissions and statistics.
 
@@ -78,6 +139,11 @@ class HYS_Scraper:
             initialized.
         save_dataframes : bool, optional
             Save the feedback and statistics dataframe, by default True.
+        fmt : str, optional
+            File format to save the dataframes in, one of "parquet", "feather", or
+            "csv", by default "parquet". Parquet and feather are both smaller on
+            disk and much faster to write and read back than csv, which remains
+            available as a legacy option.
 
         Returns
         -------
@@ -90,20 +156,52 @@ class HYS_Scraper:
             download_attachments is not None and download_attachments
         ):
             attachments_df = self._download_attachments(feedbacks_df)
-            attachments_df.to_csv(f"{self.target_dir}/attachments.csv", index=False)
+            self._save_dataframe(attachments_df, "attachments", fmt)
 
         country_df, category_df = self.scrape_statistics()
 
         if save_dataframes:
-            country_df.to_csv(f"{self.target_dir}countries.csv", index=False)
-            category_df.to_csv(f"{self.target_dir}categories.csv", index=False)
-
-            # Attachments column (each a list of strings) breaks csv
-            csv_df = feedbacks_df.drop(columns="attachments")
-            csv_df.to_csv(f"{self.target_dir}/feedbacks.csv", index=False)
+            self._save_dataframe(country_df, "countries", fmt)
+            self._save_dataframe(category_df, "categories", fmt)
+            self._save_dataframe(feedbacks_df, "feedbacks", fmt)
 
         return feedbacks_df, country_df, category_df
 
+    def _save_dataframe(self, df: pd.DataFrame, name: str, fmt: str) -> None:
+        """Save a dataframe into the target directory in the given file format.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            DataFrame to save.
+        name : str
+            Filename inside the target directory, without extension, e.g.
+            "feedbacks".
+        fmt : str
+            File format, one of "parquet", "feather", or "csv".
+
+        Raises
+        ------
+        ValueError
+            If fmt is not one of the supported file formats.
+        """
+        path = f"{self.target_dir}{name}.{fmt}"
+
+        if fmt == "parquet":
+            df.to_parquet(path, compression="snappy")
+        elif fmt == "feather":
+            df.to_feather(path)
+        elif fmt == "csv":
+            # Attachments column (each a list of strings) breaks csv
+            if "attachments" in df.columns:
+                df = df.drop(columns="attachments")
+            # Write in chunks of 10k rows, so that initiatives with tens of
+            # thousands of feedbacks never materialize the full string
+            # representation in memory at once
+            df.to_csv(path, index=False, chunksize=10_000)
+        else:
+            raise ValueError(f"Unknown dataframe file format: '{fmt}'")
+
     def scrape_publication_name(self) -> str:
         """Scrape the name of the publication that the initiative belongs to.
 
@@ -119,7 +217,7 @@ class HYS_Scraper:
         )
 
         r = self._get(url)
-        return json.loads(r)["shortTitle"]
+        return _json_loads(r)["shortTitle"]
 
     def scrape_feedbacks(self) -> pd.DataFrame:
         """Scrape the initiative's feedback submissions.
@@ -129,8 +227,8 @@ class HYS_Scraper:
         pd.DataFrame
             Feedback dataframe.
         """
-        feedbacks = self._scrape_pages()
-        return self._feedbacks_to_dataframe(feedbacks)
+        pages = self._scrape_pages()
+        return self._feedbacks_to_dataframe(pages)
 
     def _scrape_page(self, page: int = 0, size: int = None) -> dict:
         """Scrape one page worth of feedback submissions.
@@ -153,16 +251,16 @@ class HYS_Scraper:
         url += f"&size={size}" if size is not None else ""
 
         r = self._get(url)
-        return json.loads(r)
+        return _json_loads(r)
 
-    def _scrape_pages(self) -> List[dict]:
+    def _scrape_pages(self) -> List[List[dict]]:
         """Scrape all the initiative's feedback submissions.
 
         Returns
         -------
-        list[dict]
-            List of dicts, each of which represents a single submission (parsed JSON
-            from 'Have your Say' API).
+        list[list[dict]]
+            One list of dicts per page, each dict representing a single submission
+            (parsed JSON from 'Have your Say' API).
         """
         self._update_print_line("Scraping the feedback:       [⏳]")
 
@@ -170,27 +268,34 @@ class HYS_Scraper:
         initial = self._scrape_page()
         size, n_pages = initial["page"]["size"], initial["page"]["totalPages"]
 
-        feedbacks = []
-        for page in range(n_pages):
-            self._update_print_line(
-                "Scraping the feedback:       "
-                + f"[{str(page+1).rjust(len(str(n_pages)))} of {n_pages} ⏳]",
-            )
-            current = self._scrape_page(page, size=size)
-            feedbacks += current["_embedded"]["feedback"]
+        # Scrape the pages in parallel - the rate limiting in _sleep still enforces
+        # sleep_time spacing between the individual requests
+        pages = {}
+        with ThreadPoolExecutor(max_workers=self.n_workers) as executor:
+            futures = {
+                executor.submit(self._scrape_page, page, size): page
+                for page in range(n_pages)
+            }
+            for n_done, future in enumerate(as_completed(futures), start=1):
+                self._update_print_line(
+                    "Scraping the feedback:       "
+                    + f"[{str(n_done).rjust(len(str(n_pages)))} of {n_pages} ⏳]",
+                )
+                pages[futures[future]] = future.result()["_embedded"]["feedback"]
         self._update_print_line("Scraping the feedback:       [✔️ 🎉✨]", end=True)
 
-        return feedbacks
+        # Reassemble the pages in their original order
+        return [pages[page] for page in range(n_pages)]
 
     def _feedbacks_to_dataframe(
-        self, feedbacks: List[dict], comfort: bool = True
+        self, pages: List[List[dict]], comfort: bool = True
     ) -> pd.DataFrame:
-        """Convert a list of feedback dictionaries into a Pandas DataFrame.
+        """Convert a list of feedback pages into a Pandas DataFrame.
 
         Parameters
         ----------
-        feedbacks : list[dict]
-            List of feedbacks, generally from _scrape_pages.
+        pages : list[list[dict]]
+            List of feedbacks per page, generally from _scrape_pages.
         comfort : bool, optional
             Convert some of the values from 'SHOUTY' to 'normal' (i.e. lowercasing),
             snake_case the column names (by default camelCase) and parse the publication
@@ -201,8 +306,24 @@ class HYS_Scraper:
         pd.DataFrame
             DataFrame containing all feedback submissions.
         """
-        # Convert list of feedback dicts to dataframe
-        df = pd.DataFrame(feedbacks)
+        # Flatten into a single list of feedback dicts
+        feedbacks = [feedback for page in pages for feedback in page]
+
+        # Convert attachments into lists of download links in the same pass over the
+        # raw records - doing this before the dataframe exists avoids dispatching a
+        # Python lambda per row through Series.map
+        attachment_api = "https://ec.europa.eu/info/law/better-regulation/api/download/"
+        attachments = [
+            [
+                attachment_api + str(x["documentId"])
+                for x in (feedback.pop("attachments", None) or [])
+            ]
+            for feedback in feedbacks
+        ]
+
+        # Convert to a dataframe - json_normalize infers the columns in a single
+        # pass, unlike the DataFrame constructor which inspects each dict row by row
+        df = pd.json_normalize(feedbacks, max_level=0)
 
         # Drop some unnecessary columns
         df = df.drop(
@@ -210,11 +331,7 @@ class HYS_Scraper:
             errors="ignore",
         )
 
-        # Convert attachments into list of download links
-        attachment_api = "https://ec.europa.eu/info/law/better-regulation/api/download/"
-        df["attachments"] = df["attachments"].map(
-            lambda l: [attachment_api + str(x["documentId"]) for x in l]
-        )
+        df["attachments"] = attachments
 
         if comfort:
             # Go from 'SHOUTY' to 'normal'
@@ -227,8 +344,8 @@ class HYS_Scraper:
                 "governanceLevel",
                 "scope",
             }
-            for col in lowercase_cols & set(df.columns):
-                df[col] = df[col].str.lower()
+            present = list(lowercase_cols & set(df.columns))
+            df[present] = df[present].apply(lambda col: col.str.lower())
 
             # Snake case the column names
             df.columns = [self._snake_case(col) for col in df.columns]
@@ -239,10 +356,6 @@ class HYS_Scraper:
                     df["date_feedback"], errors="coerce"
                 )
 
-        # Add empty attachments column if it doesn't exist
-        if "attachments" not in df.columns:
-            df["attachments"] = [[] for _ in range(len(df))]
-
         return df
 
     def _download_attachments(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -259,44 +372,54 @@ class HYS_Scraper:
             DataFrame containing the filenames of the downloaded attachments (relative
             to target_dir).
         """
-        tmp_location = "./.tmp.pdf"
-
         # Get a id, attachment dataframe
-        df = df[["id", "attachments"]].copy()
-        df = df.explode("attachments").dropna(subset=["attachments"])
-        df = df.reset_index(drop=True)
+        df = df[["id", "attachments"]].explode("attachments")
+        df = df.dropna(subset=["attachments"]).reset_index(drop=True)
 
         # Filename is feedback id.pdf and id_2.pdf, id_3.pdf for multiple attachments
-        df["dup"] = df.groupby("id").cumcount() + 1
-        df["dup"] = df["dup"].map(lambda x: f"_{x}" if x > 1 else "")
-        df["filename"] = "attachments/" + df["id"].astype(str) + df["dup"] + ".pdf"
-
-        skipped_attachments = 0
-        for i, row in df.iterrows():
-            self._update_print_line(
-                "Downloading the attachments: "
-                + f"[{str(i+1).rjust(len(str(len(df))))} of {len(df)} ⏳]",
+        # - the duplicate suffix is built in numpy instead of a per-row lambda
+        dup = df.groupby("id").cumcount().to_numpy() + 1
+        suffix = np.where(dup > 1, np.char.add("_", dup.astype(str)), "")
+        df["filename"] = "attachments/" + df["id"].astype(str) + suffix + ".pdf"
+
+        # Filter out attachments that already exist in the target directory upfront,
+        # so that only actual work is submitted to the download pool below
+        # (astype forces a boolean mask - on an empty frame, map alone yields a
+        # non-bool Series, which ~/[] would treat as column-label selection)
+        exists = df["filename"].map(
+            lambda filename: os.path.exists(f"{self.target_dir}{filename}")
+        ).astype(bool)
+        if exists.any():
+            print(
+                f"({exists.sum()} attachments were skipped, as they already "
+                + "exist in the target directory)"
             )
+        todo = df[~exists]
 
-            filename = f"{self.target_dir}{row.filename}"
-
-            # Skip download if file already exists
-            if os.path.exists(filename):
-                skipped_attachments += 1
-                continue
-
-            # Download file to temporary location
-            self._get_file(row.attachments, tmp_location)
-
-            # Rename file into final target
-            os.rename(tmp_location, filename)
+        # Iterate the raw column arrays - iterrows would construct a Series per row
+        to_download = [
+            (url, f"{self.target_dir}{filename}")
+            for url, filename in zip(
+                todo["attachments"].to_numpy(), todo["filename"].to_numpy()
+            )
+        ]
+
+        # Download the attachments in parallel - as with the feedback pages, the
+        # rate limiting in _sleep keeps requests sleep_time apart
+        n_files = len(to_download)
+        with ThreadPoolExecutor(max_workers=self.n_workers) as executor:
+            futures = [
+                executor.submit(self._get_file, url, filename)
+                for url, filename in to_download
+            ]
+            for n_done, future in enumerate(as_completed(futures), start=1):
+                self._update_print_line(
+                    "Downloading the attachments: "
+                    + f"[{str(n_done).rjust(len(str(n_files)))} of {n_files} ⏳]",
+                )
+                future.result()
 
         self._update_print_line("Downloading the attachments: [✔️ 🎉✨]", end=True)
-        if skipped_attachments > 0:
-            print(
-                f"({skipped_attachments} attachments were skipped, as they already "
-                + "exist in the target directory)"
-            )
 
         return df[["id", "filename"]]
 
@@ -315,23 +438,29 @@ class HYS_Scraper:
         tuple[pd.DataFrame, pd.DataFrame]
             By country statistics and by category statistics dataframes.
         """
-        self._update_print_line("Scraping the statistics:     [1 of 2 ⏳]")
+        self._update_print_line("Scraping the statistics:     [⏳]")
         country_url = (
             self.base_url
             + f"brpapi/feedBackByCountry?publicationId={self.publication_id}"
         )
-        countries = json.loads(self._get(country_url))
+        category_url = (
+            self.base_url
+            + f"brpapi/feedbackByCategorOfRespondent?publicationId={self.publication_id}"
+        )
+
+        # The two endpoints are independent, so request them concurrently - both
+        # are still spaced out through the shared rate limiter
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            country_future = executor.submit(self._get, country_url)
+            category_future = executor.submit(self._get, category_url)
+            countries = _json_loads(country_future.result())
+            categories = _json_loads(category_future.result())
+
         country_df = pd.DataFrame(countries["feedbackCountryList"])
         country_df = country_df.rename(
             columns={"label": "country", "total": "n_responses"}
         )
 
-        self._update_print_line("Scraping the statistics:     [2 of 2 ⏳]")
-        category_url = (
-            self.base_url
-            + f"brpapi/feedbackByCategorOfRespondent?publicationId={self.publication_id}"
-        )
-        categories = json.loads(self._get(category_url))
         category_df = pd.DataFrame(data=categories.items(), index=categories.keys())
         category_df = category_df.rename(columns={0: "category", 1: "n_responses"})
         category_df = category_df.reset_index(drop=True)
@@ -341,39 +470,99 @@ class HYS_Scraper:
 
         return country_df, category_df
 
-    def _get(self, url: str, retries: int = 3) -> str:
+    def _create_session(self, cache_name: str = None) -> requests.Session:
+        """Create a session with connection pooling, automatic retries, and
+        (optionally) an on-disk response cache.
+
+        Parameters
+        ----------
+        cache_name : str, optional
+            Path of the SQLite-backed response cache, by default None, i.e. no
+            caching.
+
+        Returns
+        -------
+        requests.Session
+            The session, a requests_cache.CachedSession if cache_name was given.
+        """
+        if cache_name is not None:
+            session = requests_cache.CachedSession(
+                cache_name=cache_name,
+                backend="sqlite",
+                expire_after=timedelta(hours=12),
+                allowable_methods=["GET"],
+            )
+        else:
+            session = requests.Session()
+
+        retries = Retry(
+            total=3,
+            backoff_factor=1.0,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+        )
+        session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries),
+        )
+        return session
+
+    def _is_cached(self, url: str) -> bool:
+        """Whether a request to the given url would be answered from the session's
+        response cache (i.e. without hitting the server).
+
+        Parameters
+        ----------
+        url : str
+            URL.
+
+        Returns
+        -------
+        bool
+            True if a still-fresh cached response exists, False otherwise (or if
+            the session does not cache at all).
+        """
+        cache = getattr(self.session, "cache", None)
+        if cache is None:
+            return False
+
+        # cache.contains would also count expired entries, which the session
+        # re-fetches from the server - only a still-fresh response may skip the
+        # rate limiting in _get
+        response = cache.get_response(cache.create_key(requests.Request("GET", url)))
+        return response is not None and not response.is_expired
+
+    def _get(self, url: str) -> bytes:
         """HTTP GET given url.
 
         Parameters
         ----------
         url : str
             URL.
-        retries : int, optional
-            Number of retries, by default 3.
 
         Returns
         -------
-        str
-            Text returned by the server.
+        bytes
+            Raw response body - returned undecoded so that the JSON parser can do
+            the UTF-8 decoding in a single pass.
 
         Raises
         ------
-        RuntimeError
-            If the number of retries is exceeded.
+        requests.exceptions.RetryError
+            If the server keeps responding with a retried status code (429/5xx)
+            until the session's automatic retries are exhausted.
+        requests.HTTPError
+            If the server responds with a non-retried error status code (e.g.
+            404).
         """
-        self._sleep()
-
-        r = requests.get(url)
-        self.last_request = time.time()
+        # No need to rate limit requests that are answered from the local cache
+        if not self._is_cached(url):
+            self._sleep()
 
-        if r.status_code != 200:
-            if retries > 0:
-                return self._get(url, retries=retries - 1)
-            raise RuntimeError(
-                f"\nError while accessing {url} - status code: [{r.status_code}]"
-            )
+        r = self.session.get(url, timeout=(5, 30))
+        r.raise_for_status()
 
-        return r.text
+        return r.content
 
     def _get_file(self, url: str, target: str) -> None:
         """Download a (binary) file to given location.
@@ -387,13 +576,75 @@ class HYS_Scraper:
         """
         self._sleep()
 
-        pdf = requests.get(url, stream=True)
-        with open(target, "wb") as f:
-            for chunk in pdf.iter_content(chunk_size=1024):
-                if chunk:
-                    f.write(chunk)
+        # Stream into a unique temporary file next to the target and rename once
+        # complete - concurrent downloads can't clobber each other and interrupted
+        # runs don't leave half-written files behind under the final name
+        tmp_location = target + ".part"
+
+        with open(tmp_location, "wb", buffering=1 << 20) as f:
+            if self._pdf_client is not None:
+                self._stream_http2(url, f)
+            else:
+                # PDFs are kept out of the response cache - they are already
+                # persisted to disk and would only bloat the cache's SQLite file.
+                # Uses the per-request no-store directive since cache_disabled()
+                # toggles session-wide state and is not safe across worker threads
+                pdf = self.session.get(
+                    url,
+                    stream=True,
+                    timeout=(5, 30),
+                    headers={"Cache-Control": "no-store"},
+                )
+                # Raise before writing, so an error body never ends up in the
+                # (otherwise renamed-into-place) .part file
+                pdf.raise_for_status()
+
+                # Copy from the raw socket in 64KiB chunks - with 1KiB chunks, the
+                # Python-level loop dominated for multi-megabyte PDFs
+                pdf.raw.decode_content = True
+                shutil.copyfileobj(pdf.raw, f, length=64 * 1024)
+        os.rename(tmp_location, target)
+
+    def _stream_http2(self, url: str, f, retries: int = 3) -> None:
+        """Stream the given URL over the HTTP/2 client into an open file in 64KiB
+        chunks.
+
+        Transient errors (status codes 429 and 5xx) are retried with exponential
+        backoff, honoring Retry-After where the server sends one - mirroring the
+        Retry configuration of the requests session.
 
-        self.last_request = time.time()
+        Parameters
+        ----------
+        url : str
+            URL of the file to download.
+        f : io.BufferedWriter
+            Open (binary mode) file object to write the response body into.
+        retries : int, optional
+            Number of retries for transient errors, by default 3.
+
+        Raises
+        ------
+        httpx.HTTPStatusError
+            If the server still responds with an error status code after the
+            retries are exhausted.
+        """
+        delay = 0.0
+        for attempt in range(retries + 1):
+            if delay > 0:
+                time.sleep(delay)
+
+            with self._pdf_client.stream("GET", url) as pdf:
+                if attempt < retries and pdf.status_code in (429, 500, 502, 503, 504):
+                    retry_after = pdf.headers.get("Retry-After", "")
+                    delay = float(retry_after) if retry_after.isdigit() else 2**attempt
+                    continue
+
+                # Raise before writing, so an error body never ends up in the
+                # (otherwise renamed-into-place) .part file
+                pdf.raise_for_status()
+                for chunk in pdf.iter_bytes(64 * 1024):
+                    f.write(chunk)
+                return
 
     def _create_output_folder(self) -> None:
         """Create the target folder if it doesn't exist and do the same for the
@@ -413,10 +664,20 @@ class HYS_Scraper:
     def _sleep(self) -> None:
         """Depending on the time of the last request to 'Have your Say', sleep for the
         necessary time to match sleep_time.
+
+        Thread-safe: each caller reserves the next free request slot (token-bucket
+        style), so concurrent requests remain sleep_time apart globally. Deadlines
+        use time.monotonic, which is immune to wall-clock (e.g. NTP) jumps.
         """
-        # If less than sleep_time seconds since completion of last request, sleep
-        if time.time() - self.last_request <= self.sleep_time:
-            time.sleep(self.sleep_time - (time.time() - self.last_request))
+        # Reserve the next request slot, at least sleep_time after the previous one
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed)
+            self._next_allowed = slot + self.sleep_time
+
+        # Sleep until the reserved slot has arrived
+        if slot > now:
+            time.sleep(slot - now)
 
     def _snake_case(self, line: str) -> str:
         """Snake case the input line.
@@ -431,8 +692,9 @@ class HYS_Scraper:
         str
             Snake cased input string.
         """
-        line = line.replace(" ", "_")
-        return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", line).lower()
+        # Use the precompiled pattern - re.sub would look it up in re's cache on
+        # every call, and this runs once per column name and category
+        return _SNAKE_CASE_RE.sub(r"\1_\2", line.replace(" ", "_")).lower()
 
     def _update_print_line(self, line: str, end: bool = False) -> None:
         """Update the line currently printed to the console with a new one.
@@ -445,7 +707,18 @@ class HYS_Scraper:
             Whether to end writing to this line, by default False. True adds a newline
             to the input string, i.e. moves the cursor into the next line.
         """
-        print("\r" * self.max_print, end="")
-        print(line.ljust(self.max_print), end="" if not end else "\n")
-        sys.stdout.flush()  # Make sure new line is actually printed in console
+        # Not attached to a terminal (e.g. piped into a log file): skip the
+        # intermediate redraws and only emit the final state of each line
+        if not sys.stdout.isatty():
+            if end:
+                sys.stdout.write(line + "\n")
+                sys.stdout.flush()
+            return
+
+        self._n_updates += 1
+        sys.stdout.write("\r" + line.ljust(self.max_print) + ("\n" if end else ""))
+        # Each flush is a syscall, so only flush every couple of updates (or once
+        # the line is final)
+        if end or self._n_updates % 10 == 0:
+            sys.stdout.flush()
         self.max_print = max(len(line), self.max_print)